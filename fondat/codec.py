@@ -164,12 +164,21 @@ def _s2j(s):
         raise DecodeError from e
 
 
-@contextmanager
-def _wrap(exception):
-    try:
-        yield
-    except Exception as e:
-        raise exception from e
+class _wrap:
+    """Context manager to raise the specified exception from any exception raised."""
+
+    __slots__ = {"exception"}
+
+    def __init__(self, exception):
+        self.exception = exception
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and issubclass(exc_type, Exception):
+            raise self.exception from exc_value
+        return False
 
 
 # ----- str -----
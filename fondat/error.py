@@ -1,25 +1,39 @@
 """Resource error module."""
 
+import builtins
 import http
+import sys
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
 
 
 class Error(Exception):
     """
     Base class for resource errors.
 
-    All error classes must include the following attributes:
+    All error classes include the following class attributes:
     • status: HTTP status code (int)
     • phrase: HTTP reason phrase
+    • phrase_bytes: HTTP reason phrase, encoded as bytes
+
+    Base classes provide defaults: 400 for client errors, 500 for all others.
     """
 
+    status = 500
+    phrase = "Internal Server Error"
+    phrase_bytes = b"Internal Server Error"
+
 
 class ClientError(Error):
     """
     Base class for client resource errors.
     """
 
+    status = 400
+    phrase = "Bad Request"
+    phrase_bytes = b"Bad Request"
+
 
 class ServerError(Error):
     """
@@ -27,6 +41,59 @@ class ServerError(Error):
     """
 
 
+# error class names for http.HTTPStatus names; avoids deriving them at import
+_NAME_FIXUPS = {
+    "BAD_REQUEST": "BadRequestError",
+    "UNAUTHORIZED": "UnauthorizedError",
+    "PAYMENT_REQUIRED": "PaymentRequiredError",
+    "FORBIDDEN": "ForbiddenError",
+    "NOT_FOUND": "NotFoundError",
+    "METHOD_NOT_ALLOWED": "MethodNotAllowedError",
+    "NOT_ACCEPTABLE": "NotAcceptableError",
+    "PROXY_AUTHENTICATION_REQUIRED": "ProxyAuthenticationRequiredError",
+    "REQUEST_TIMEOUT": "RequestTimeoutError",
+    "CONFLICT": "ConflictError",
+    "GONE": "GoneError",
+    "LENGTH_REQUIRED": "LengthRequiredError",
+    "PRECONDITION_FAILED": "PreconditionFailedError",
+    "REQUEST_ENTITY_TOO_LARGE": "RequestEntityTooLargeError",
+    "REQUEST_URI_TOO_LONG": "RequestURITooLongError",
+    "UNSUPPORTED_MEDIA_TYPE": "UnsupportedMediaTypeError",
+    "REQUESTED_RANGE_NOT_SATISFIABLE": "RequestedRangeNotSatisfiableError",
+    "EXPECTATION_FAILED": "ExpectationFailedError",
+    "IM_A_TEAPOT": "ImATeapotError",
+    "MISDIRECTED_REQUEST": "MisdirectedRequestError",
+    "UNPROCESSABLE_ENTITY": "UnprocessableEntityError",
+    "LOCKED": "LockedError",
+    "FAILED_DEPENDENCY": "FailedDependencyError",
+    "TOO_EARLY": "TooEarlyError",
+    "UPGRADE_REQUIRED": "UpgradeRequiredError",
+    "PRECONDITION_REQUIRED": "PreconditionRequiredError",
+    "TOO_MANY_REQUESTS": "TooManyRequestsError",
+    "REQUEST_HEADER_FIELDS_TOO_LARGE": "RequestHeaderFieldsTooLargeError",
+    "UNAVAILABLE_FOR_LEGAL_REASONS": "UnavailableForLegalReasonsError",
+    "INTERNAL_SERVER_ERROR": "InternalServerError",
+    "NOT_IMPLEMENTED": "NotImplementedError",
+    "BAD_GATEWAY": "BadGatewayError",
+    "SERVICE_UNAVAILABLE": "ServiceUnavailableError",
+    "GATEWAY_TIMEOUT": "GatewayTimeoutError",
+    "HTTP_VERSION_NOT_SUPPORTED": "HTTPVersionNotSupportedError",
+    "VARIANT_ALSO_NEGOTIATES": "VariantAlsoNegotiatesError",
+    "INSUFFICIENT_STORAGE": "InsufficientStorageError",
+    "LOOP_DETECTED": "LoopDetectedError",
+    "NOT_EXTENDED": "NotExtendedError",
+    "NETWORK_AUTHENTICATION_REQUIRED": "NetworkAuthenticationRequiredError",
+}
+
+
+def _error_name(status_name: str) -> str:
+    """Derive error class name from an http.HTTPStatus name."""
+    name = "".join(w.title() if w not in {"HTTP", "URI"} else w for w in status_name.split("_"))
+    if not name.endswith("Error"):
+        name += "Error"
+    return name
+
+
 class _Errors:
     """
     Encapsulates resource error exception classes. Errors are dynamically generated from
@@ -37,25 +104,32 @@ class _Errors:
     """
 
     def __init__(self):
-        self._names = {}
-        self._codes = {}
-        for status in (s for s in http.HTTPStatus if 400 <= s.value <= 599):
-            name = "".join(
-                w.title() if w not in {"HTTP", "URI"} else w for w in status.name.split("_")
-            )
-            if not name.endswith("Error"):
-                name += "Error"
+        statuses = [
+            (s.value, s.name, s.phrase, s.description)
+            for s in http.HTTPStatus
+            if 400 <= s.value <= 599
+        ]
+        names = {}
+        codes = {}
+        for value, status_name, phrase, description in statuses:
+            name = _NAME_FIXUPS.get(status_name) or _error_name(status_name)
+            name = sys.intern(name)
+            phrase = sys.intern(phrase)
             error = type(
                 name,
-                (ClientError if 400 <= status.value <= 499 else ServerError,),
+                (ClientError if 400 <= value <= 499 else ServerError,),
                 {
-                    "status": status.value,
-                    "phrase": status.phrase,
-                    "__doc__": f"{status.description or status.phrase.capitalize()}.",
+                    "status": value,
+                    "phrase": phrase,
+                    "phrase_bytes": phrase.encode(),
+                    "__doc__": f"{description or phrase.capitalize()}.",
                 },
             )
-            self._names[name] = error
-            self._codes[status.value] = error
+            names[name] = error
+            codes[value] = error
+        self._names = MappingProxyType(names)
+        self._codes = MappingProxyType(codes)
+        self.__dict__.update(names)  # resolve errors.<name> without __getattr__
 
     def get(self, code: int, default=None) -> Error:
         """Return error for code."""
@@ -65,9 +139,7 @@ class _Errors:
         return self._codes[code]
 
     def __getattr__(self, name: str) -> Error:
-        if error := self._names.get(name):
-            return error
-        raise AttributeError
+        raise AttributeError(name)
 
     def __iter__(self) -> Iterator[Error]:
         return iter(self._codes.values())
@@ -75,6 +147,15 @@ class _Errors:
 
 errors = _Errors()
 
+# read-only mapping of HTTP status code to error class
+_ERRORS_BY_CODE = errors._codes
+
+# all errors are importable from this module by name, except those shadowing builtins
+for _name, _error in errors._names.items():
+    if not hasattr(builtins, _name):
+        globals()[_name] = _error
+del _name, _error
+
 
 # commonly used errors
 BadRequestError: ClientError = errors.BadRequestError
@@ -83,3 +164,21 @@ InternalServerError: ServerError = errors.InternalServerError
 MethodNotAllowedError: ClientError = errors.MethodNotAllowedError
 NotFoundError: ClientError = errors.NotFoundError
 UnauthorizedError: ClientError = errors.UnauthorizedError
+
+
+class STATUS:
+    """
+    HTTP status codes as int class attributes, named as in the http.HTTPStatus enum.
+    Example: fondat.error.STATUS.NOT_FOUND == 404
+    """
+
+
+for _name, _status in http.HTTPStatus.__members__.items():  # includes aliases
+    setattr(STATUS, _name, _status.value)
+del _name, _status
+
+
+# read-only mapping of HTTP status code to encoded reason phrase
+STATUS_PHRASE: Mapping[int, bytes] = MappingProxyType(
+    {s.value: s.phrase.encode() for s in http.HTTPStatus}
+)
@@ -8,7 +8,6 @@ import fondat.error
 import fondat.resource
 import fondat.types
 import functools
-import http
 import http.cookies
 import inspect
 import logging
@@ -20,6 +19,7 @@ from collections.abc import Callable, Iterable, MutableSequence
 from fondat.codec import Binary, JSON, String, get_codec, DecodeError
 from fondat.data import datacls
 from fondat.error import (
+    STATUS,
     BadRequestError,
     InternalServerError,
     MethodNotAllowedError,
@@ -121,7 +121,7 @@ class Response(Message):
         headers: Optional[Headers] = None,
         cookies: Optional[Cookies] = None,
         body: Optional[Stream] = None,
-        status: int = http.HTTPStatus.OK.value,
+        status: int = STATUS.OK,
     ):
         super().__init__(headers=headers, cookies=cookies, body=body)
         self.status = status
@@ -588,7 +588,7 @@ class Application:
         response.headers["Content-Type"] = response.body.content_type
         if response.body.content_length is not None:
             if response.body.content_length == 0:
-                response.status = http.HTTPStatus.NO_CONTENT.value
+                response.status = STATUS.NO_CONTENT
             else:
                 response.headers["Content-Length"] = str(response.body.content_length)
         return response
@@ -23,12 +23,14 @@ class LazyMap(MutableMapping):
     To lazily initialize a value, set it to a no-argument function callback that has been
     decorated with the @lazy decorator. When the value is then first accessed, the callback
     will be called to initialize the value. The resulting value will then be stored in the
-    mapping.
+    mapping. Values are initialized under per-key locks, so initializing one value does not
+    block initializing another.
     """
 
     def __init__(self, init=None):
         super().__init__()
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # guards _locks
+        self._locks = {}
         self._store = {}
         if init is not None:
             for key, value in init.items():
@@ -36,11 +38,16 @@ class LazyMap(MutableMapping):
 
     def __getitem__(self, key):
         value = self._store[key]
-        if is_lazy(value):
-            with self._lock:
-                value = self._store[key]
-                if is_lazy(value):  # prevent race
-                    self._store[key] = value = value()
+        if not is_lazy(value):
+            return value
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            value = self._store[key]
+            if is_lazy(value):  # prevent race
+                self._store[key] = value = value()
+            with self._lock:  # only once initialized, so retries serialize on the same lock
+                self._locks.pop(key, None)
         return value
 
     def __setitem__(self, key, value):
@@ -7,6 +7,7 @@ application monitor(s) can be added to/deleted from this object.
 
 import collections
 import fondat.validation
+import functools
 import logging
 import re
 import time
@@ -20,7 +21,7 @@ from typing import Any, Literal, Optional, Union
 _logger = logging.getLogger(__name__)
 
 
-_now = lambda: datetime.now(tz=timezone.utc)
+_now = functools.partial(datetime.now, timezone.utc)
 
 
 @dataclass
@@ -619,6 +619,26 @@ def _any_schema(*, python_type, annotated, origin, args, **_):
         return Schema(**_kwargs(python_type, annotated))
 
 
+def _resource_attr(resource, name):
+    """
+    Return the named attribute of a resource. A property whose getter is annotated to return
+    a resource is returned unevaluated, as its property object; all other attributes,
+    including other properties, are evaluated.
+    """
+    try:
+        attr = inspect.getattr_static(resource, name)
+    except AttributeError:
+        return getattr(resource, name)  # dynamic attribute (e.g. container resource)
+    if isinstance(attr, property):
+        try:
+            returns = typing.get_type_hints(attr.fget).get("return")
+        except Exception:
+            returns = None
+        if fondat.resource.is_resource(returns):
+            return attr
+    return getattr(resource, name)
+
+
 class Processor:
     """Processes resource and populates OpenAPI document."""
 
@@ -644,7 +664,7 @@ class Processor:
             or None
         )
         for name in (n for n in dir(resource) if not n.startswith("_")):
-            attr = getattr(resource, name)
+            attr = _resource_attr(resource, name)
             if res := self.resource(attr):
                 self.process(
                     res,
@@ -719,7 +739,7 @@ class Processor:
         if callable(obj):
             try:
                 returns = typing.get_type_hints(obj)["return"]
-            except:
+            except Exception:
                 return None
             if fondat.resource.is_resource(returns):
                 return returns
@@ -18,9 +18,10 @@ import fondat.context as context
 import fondat.monitoring as monitoring
 import logging
 import types
+import weakref
 import wrapt
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from copy import deepcopy
 from fondat.error import BadRequestError, ForbiddenError, UnauthorizedError
 from fondat.security import Policy
@@ -47,6 +48,29 @@ def _summary(function):
     return " ".join(result)
 
 
+# resource class → operation name → tags; weak so discarded resource classes can be collected
+_operation_tags_cache = weakref.WeakKeyDictionary()
+
+
+def _operation_tags(resource_class: type, operation_name: str):
+    """Return context, timer and counter tags for an operation of a resource class."""
+    try:
+        return _operation_tags_cache[resource_class][operation_name]
+    except KeyError:
+        pass
+    tags = {
+        "resource": f"{resource_class.__module__}.{resource_class.__qualname__}",
+        "operation": operation_name,
+    }
+    result = (
+        types.MappingProxyType({"context": "fondat.operation", **tags}),
+        types.MappingProxyType({"name": "operation_duration_seconds", **tags}),
+        types.MappingProxyType({"name": "operation_calls_total", **tags}),
+    )
+    _operation_tags_cache.setdefault(resource_class, {})[operation_name] = result
+    return result
+
+
 async def authorize(policies: Iterable[Policy]):
     """
     Evaluate the specified security policies.
@@ -64,8 +88,13 @@ async def authorize(policies: Iterable[Policy]):
     If security policies all raise security exceptions, then the first ForbiddenError exception
     is raised if encountered, otherwise the first UnauthorizedError exception is raised.
     """
+    if not policies:
+        return
+    if isinstance(policies, Sequence) and len(policies) == 1:
+        await policies[0].apply()  # its exception is the first exception
+        return
     exception = None
-    for policy in policies or ():
+    for policy in policies:
         try:
             await policy.apply()
             return  # security policy authorized the operation
@@ -75,8 +104,6 @@ async def authorize(policies: Iterable[Policy]):
         except UnauthorizedError as ue:
             if not exception:
                 exception = ue
-        except:
-            raise
     if exception:
         raise exception
 
@@ -97,7 +124,30 @@ def resource(wrapped: Optional[type] = None, *, tag: Optional[str] = None):
 
 Method = Literal["get", "put", "post", "delete", "patch"]
 
-_methods = set(get_args(Method))
+_methods = frozenset(get_args(Method))
+
+
+class _Operation:
+    """Operation attributes, stored in a decorated coroutine's _fondat_operation attribute."""
+
+    __slots__ = {
+        "method",
+        "type",
+        "policies",
+        "publish",
+        "deprecated",
+        "summary",
+        "description",
+    }
+
+    def __init__(self, *, method, type, policies, publish, deprecated, summary, description):
+        self.method = method
+        self.type = type
+        self.policies = policies
+        self.publish = publish
+        self.deprecated = deprecated
+        self.summary = summary
+        self.description = description
 
 
 @validate_arguments
@@ -143,7 +193,7 @@ def operation(
     if method is None:
         method = wrapped.__name__
         if method not in _methods:
-            raise TypeError(f"method must be one of: {_methods}")
+            raise TypeError(f"method must be one of: {', '.join(get_args(Method))}")
 
     if not type:
         type = "query" if method == "get" else "mutation"
@@ -160,35 +210,40 @@ def operation(
         elif p.kind is p.VAR_KEYWORD:
             raise TypeError("operation with **kwargs is not supported")
 
+    fondat_op = _Operation(
+        method=method,
+        type=type,
+        policies=policies,
+        publish=publish,
+        deprecated=deprecated,
+        summary=summary,
+        description=description,
+    )
+    operation_name = wrapped.__name__
+
     @wrapt.decorator
     async def wrapper(wrapped, instance, args, kwargs):
         args, kwargs = deepcopy(args), deepcopy(kwargs)  # avoid side effects
-        operation = getattr(wrapped, "_fondat_operation")
-        resource_name = f"{instance.__class__.__module__}.{instance.__class__.__qualname__}"
-        operation_name = wrapped.__name__
-        tags = {"resource": resource_name, "operation": operation_name}
+        context_tags, timer_tags, counter_tags = _operation_tags(
+            instance.__class__, operation_name
+        )
         _logger.debug(
-            "operation: %s.%s(args=%s, kwargs=%s)", resource_name, operation_name, args, kwargs
+            "operation: %s.%s(args=%s, kwargs=%s)",
+            context_tags["resource"],
+            context_tags["operation"],
+            args,
+            kwargs,
         )
-        with context.push({"context": "fondat.operation", **tags}):
-            async with monitoring.timer({"name": "operation_duration_seconds", **tags}):
-                async with monitoring.counter({"name": "operation_calls_total", **tags}):
-                    await authorize(operation.policies)
+        with context.push(context_tags):
+            async with monitoring.timer(timer_tags):
+                async with monitoring.counter(counter_tags):
+                    await authorize(fondat_op.policies)
                     try:
                         return await wrapped(*args, **kwargs)
                     except ValidationError as ve:
                         raise BadRequestError from ve
 
-    wrapped._fondat_operation = types.SimpleNamespace(
-        method=method,
-        type=type,
-        policies=policies,
-        publish=publish,
-        deprecated=deprecated,
-        summary=summary,
-        description=description,
-    )
-
+    wrapped._fondat_operation = fondat_op
     wrapped = validate_arguments(wrapped)
     return wrapper(wrapped)
 
@@ -165,13 +165,23 @@ def _validate_literal(value, args):
     raise ValidationError(f"expecting one of: {args}; received: {value}")
 
 
-@contextmanager
-def validation_error_path(segment: Any):
-    try:
-        yield
-    except ValidationError as ve:
-        ve.path = (ve.path or []).insert(0, segment)
-        raise
+class validation_error_path:
+    """Context manager to prepend a segment to the path of a raised ValidationError."""
+
+    __slots__ = {"segment"}
+
+    def __init__(self, segment: Any):
+        self.segment = segment
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and issubclass(exc_type, ValidationError):
+            if exc_value.path is None:
+                exc_value.path = []
+            exc_value.path.insert(0, self.segment)
+        return False
 
 
 def _validate_typeddict(value, python_type):
@@ -275,6 +285,9 @@ def validate(value: Any, type_hint: Any) -> NoneType:
 def validate_arguments(callable: Callable):
     """Decorate a function or coroutine to validate its arguments using type annotations."""
 
+    if all(name == "return" for name in getattr(callable, "__annotations__", {})):
+        return callable  # no parameter annotations; nothing to validate
+
     sig = inspect.signature(callable)
 
     positional_params = [
@@ -283,8 +296,12 @@ def validate_arguments(callable: Callable):
         if p.kind in {p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD}
     ]
 
+    hints = None  # resolved on first call, allowing forward references
+
     def _validate(instance, args, kwargs):
-        hints = typing.get_type_hints(callable, include_extras=True)
+        nonlocal hints
+        if hints is None:
+            hints = typing.get_type_hints(callable, include_extras=True)
         if instance:
             args = (instance, *args)
         params = {
@@ -1,9 +1,52 @@
 import pytest
 
 import fondat.error as error
+import http
 
 
 def test_get_error_code():
     assert error.errors[400] == error.BadRequestError
     assert error.errors[404] == error.NotFoundError
     assert error.errors[500] == error.InternalServerError
+
+
+def test_errors_by_code_read_only():
+    assert error._ERRORS_BY_CODE[404] is error.NotFoundError
+    with pytest.raises(TypeError):
+        error._ERRORS_BY_CODE[404] = error.BadRequestError
+
+
+def test_get_error_name():
+    assert error.errors.NotFoundError is error.errors[404]
+    assert error.ConflictError is error.errors[409]
+    with pytest.raises(AttributeError):
+        error.errors.NoSuchError
+
+
+def test_builtin_not_shadowed():
+    assert "NotImplementedError" not in vars(error)
+    assert error.errors.NotImplementedError is error.errors[501]
+
+
+def test_phrase_bytes():
+    assert error.NotFoundError.phrase == "Not Found"
+    assert error.NotFoundError.phrase_bytes == b"Not Found"
+
+
+def test_base_class_status():
+    class E1(error.ClientError):
+        pass
+
+    class E2(error.ServerError):
+        pass
+
+    assert E1().status == 400
+    assert E2().status == 500
+
+
+def test_status():
+    assert error.STATUS.OK == 200
+    assert error.STATUS.NOT_FOUND == 404
+    for name, status in http.HTTPStatus.__members__.items():
+        assert getattr(error.STATUS, name) == status.value
+    assert error.STATUS_PHRASE[404] == b"Not Found"
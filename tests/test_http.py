@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from fondat.codec import Binary, get_codec
 from fondat.http import Application, AsBody, InBody, Request, Response, simple_error_filter
 from fondat.resource import resource, operation
-from fondat.stream import Stream, BytesStream
+from fondat.stream import Stream, BytesStream, stream_bytes
 from typing import Annotated, Optional
 from uuid import UUID
 
@@ -17,7 +17,7 @@ pytestmark = pytest.mark.asyncio
 
 async def body(message):
     """Extract body from message."""
-    return b"".join([b async for b in message.body])
+    return await stream_bytes(message.body)
 
 
 async def test_simple():
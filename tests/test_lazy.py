@@ -52,6 +52,24 @@ def test_lazymap():
     assert len(map) == 0
 
 
+def test_lazymap_nested_init():
+    map = LazyMap()
+    map["a"] = lazy(lambda: f"{map['b']}_a")
+    map["b"] = lz2
+    assert map["a"] == "lz2_value_a"
+    assert map["b"] == "lz2_value"
+
+
+def test_lazymap_init_error():
+    @lazy
+    def fail():
+        raise RuntimeError
+
+    map = LazyMap({"a": fail})
+    with pytest.raises(RuntimeError):
+        map["a"]
+
+
 def test_lazy_import():
     m = lazy_import("csv")
     m = m()
@@ -245,5 +245,49 @@ def test_openapi_generate_openapi_specification():
     js = get_codec(JSON, fondat.openapi.OpenAPI).encode(result)
 
 
+def test_property_not_evaluated():
+    @resource
+    class R1:
+        @operation
+        async def get(self) -> str:
+            return "str"
+
+    @resource
+    class R2:
+        @property
+        def r1(self) -> R1:
+            raise RuntimeError("property evaluated")
+
+    info = fondat.openapi.Info(title="title", version="version")
+    doc = generate_openapi(resource=R2(), info=info)
+    assert doc.paths["/r1"].get is not None
+
+
+def test_property_evaluated_without_resource_hint():
+    @resource
+    class R1:
+        @operation
+        async def get(self) -> str:
+            return "str"
+
+    @resource
+    class R2:
+        @property
+        def r1(self):
+            return R1()
+
+        @property
+        def c(self) -> R1:
+            return R1()
+
+        @property
+        def cont(self):
+            return container_resource({"x": R1()})
+
+    info = fondat.openapi.Info(title="title", version="version")
+    doc = generate_openapi(resource=R2(), info=info)
+    assert sorted(doc.paths) == ["/c", "/cont/x", "/r1"]
+
+
 # import json
 # print(json.dumps(js))
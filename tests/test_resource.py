@@ -1,11 +1,14 @@
 import pytest
 
 import fondat.resource
+import gc
+import weakref
 
 from dataclasses import dataclass
 from fondat.annotation import Description
-from fondat.error import BadRequestError
+from fondat.error import BadRequestError, ForbiddenError
 from fondat.resource import resource, operation, query, mutation
+from fondat.security import Policy
 from typing import Annotated, Optional
 from uuid import UUID
 
@@ -74,6 +77,28 @@ class R2:
         return "str"
 
 
+async def test_unannotated_params_copied_and_authorized():
+    async def forbid():
+        raise ForbiddenError
+
+    @resource
+    class R:
+        @mutation
+        async def append(self, items) -> str:
+            items.append("x")
+            return "appended"
+
+        @mutation(policies=[Policy(rules=[forbid])])
+        async def forbidden(self, items) -> str:
+            return "forbidden"
+
+    items = []
+    assert await R().append(items) == "appended"
+    assert items == []
+    with pytest.raises(ForbiddenError):
+        await R().forbidden(items)
+
+
 def test_container():
     root = fondat.resource.container_resource({"r1": R1(), "r2": R2()})
     assert root.r1.__class__ is R1
@@ -96,3 +121,17 @@ def test_invalid_method():
             @operation
             async def invalid_method_name(self) -> None:
                 pass
+
+
+async def test_resource_class_collectable():
+    @resource
+    class R:
+        @query
+        async def get(self) -> str:
+            return "r"
+
+    assert await R().get() == "r"
+    ref = weakref.ref(R)
+    del R
+    gc.collect()
+    assert ref() is None
@@ -3,7 +3,7 @@ import pytest
 import fondat.context as context
 
 from fondat.error import UnauthorizedError, ForbiddenError
-from fondat.resource import resource, mutation
+from fondat.resource import authorize, resource, mutation
 from fondat.security import Policy
 
 
@@ -91,3 +91,11 @@ async def test_security_forbidden():
 async def test_security_forbidden_wins():
     with pytest.raises(ForbiddenError):
         await R1().forbidden_wins()
+
+
+async def test_authorize_returns_none():
+    class ValuePolicy(Policy):
+        async def apply(self):
+            return "value"
+
+    assert await authorize([ValuePolicy()]) is None
@@ -486,6 +486,13 @@ async def test_async_decorator_arguments_error():
         await fn("1")
 
 
+def test_decorator_no_annotations():
+    def fn(a, b) -> str:
+        return f"{a}{b}"
+
+    assert validate_arguments(fn) is fn
+
+
 def test_sync_decorator_return_success():
     @validate_return_value
     def fn() -> str:
@@ -520,3 +527,10 @@ async def test_async_decorator_return_error():
 
     with pytest.raises(ValidationError):
         await coro()
+
+
+def test_error_path():
+    DC = make_dataclass("DC", [("a", list[int])])
+    with pytest.raises(ValidationError) as ei:
+        validate(DC(a=[1, "2"]), DC)
+    assert ei.value.path == ["a", 1]